@@ -1,3 +1,4 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 import os
@@ -9,6 +10,12 @@ class Settings(BaseSettings):
     
     # Temporary directory for video processing
     TEMP_DIR: str = "/tmp"
+
+    # Videos at least this large are downloaded as concurrent byte ranges
+    DOWNLOAD_SEGMENT_THRESHOLD: int = Field(32 * 1024 * 1024, gt=0)
+    DOWNLOAD_SEGMENT_SIZE: int = Field(8 * 1024 * 1024, gt=0)
+    DOWNLOAD_MAX_CONNECTIONS: int = Field(8, gt=0)
+    DOWNLOAD_RANGE_RETRIES: int = Field(3, ge=0)
     
     # OpenAI API settings
     OPENAI_API_KEY: str
@@ -16,6 +23,10 @@ class Settings(BaseSettings):
     # ElevenLabs API settings
     ELEVENLABS_API_KEY: str
 
+    # Initialize external services in the background at startup instead of
+    # on the first request that needs them
+    WARM_UP_ON_STARTUP: bool = False
+
     class Config:
         env_file = ".env"
 
@@ -1,6 +1,18 @@
+import time
+
+_import_started = time.perf_counter()
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
 from .routes import video, ai
+from .services.firebase import FirebaseService
+from .services.openai import OpenAIService
+from .services.elevenlabs import ElevenLabsService
+from .config import settings
+from typing import Optional
+import asyncio
 import logging
 
 # Configure logging
@@ -9,10 +21,50 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+logger = logging.getLogger(__name__)
+
+# Services that are initialized lazily and reported by the readiness endpoint
+SERVICES = {
+    "firebase": FirebaseService,
+    "openai": OpenAIService,
+    "elevenlabs": ElevenLabsService,
+}
+
+# Time from module import until the app is ready to accept requests
+startup_time_ms: float = 0.0
+
+# Background warm-up started by the lifespan when WARM_UP_ON_STARTUP is enabled
+warm_up_task: Optional[asyncio.Task] = None
+
+async def warm_up_services():
+    """Initialize all services in the background without blocking startup"""
+    for name, service_cls in SERVICES.items():
+        try:
+            await asyncio.to_thread(service_cls().warm_up)
+            logger.info(f"🔥 Warmed up {name} service")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to warm up {name} service: {str(e)}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global startup_time_ms, warm_up_task
+
+    if settings.WARM_UP_ON_STARTUP:
+        warm_up_task = asyncio.create_task(warm_up_services())
+
+    startup_time_ms = (time.perf_counter() - _import_started) * 1000
+    logger.info(f"🚀 Application started in {startup_time_ms:.1f} ms")
+
+    yield
+
+    if warm_up_task and not warm_up_task.done():
+        warm_up_task.cancel()
+
 app = FastAPI(
     title="Video Processing API",
     description="API for processing and combining videos",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -33,4 +85,38 @@ async def root():
     return {
         "status": "ok",
         "message": "Video Processing API is running"
-    } 
\ No newline at end of file
+    }
+
+@app.get("/ready")
+async def ready():
+    """Report which services have been initialized"""
+    services = {}
+    errors = {}
+    for name, service_cls in SERVICES.items():
+        if service_cls.is_ready():
+            services[name] = "ready"
+        elif service_cls.init_error():
+            services[name] = "error"
+            errors[name] = service_cls.init_error()
+        else:
+            # Services are initialized on first use unless warm-up is enabled
+            services[name] = "cold"
+
+    if errors:
+        status = "error"
+    elif warm_up_task is not None and not warm_up_task.done():
+        status = "warming"
+    else:
+        status = "ready"
+
+    body = {
+        "status": status,
+        "warm_up_enabled": settings.WARM_UP_ON_STARTUP,
+        "services": services,
+        "errors": errors,
+        "startup_time_ms": round(startup_time_ms, 1)
+    }
+    # Readiness probes only look at the status code
+    if status != "ready":
+        return JSONResponse(status_code=503, content=body)
+    return body
@@ -15,10 +15,14 @@ class AudioAddRequest(BaseModel):
 class VideoResponse(BaseModel):
     status: str
     url: Optional[HttpUrl] = None
+    preview_url: Optional[HttpUrl] = None
+    thumbnail_urls: Optional[List[HttpUrl]] = None
     message: Optional[str] = None
     error: Optional[str] = None
 
 class ProgressResponse(BaseModel):
     progress: int
     stage: str
-    status: str = "processing" 
\ No newline at end of file
+    status: str = "processing"
+    url: Optional[HttpUrl] = None
+    thumbnail_urls: Optional[List[HttpUrl]] = None 
\ No newline at end of file
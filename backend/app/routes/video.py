@@ -1,10 +1,13 @@
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from ..services.firebase import FirebaseService
 from ..services.video import VideoProcessor
+from ..config import settings
 from ..models.video import VideoCombineRequest, AudioAddRequest, VideoResponse, ProgressResponse
 from pathlib import Path
 import asyncio
-from typing import Dict, Optional
+import os
+import shutil
+from typing import Dict, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,12 +18,171 @@ video_processor = VideoProcessor()
 # Store progress information
 progress_store: Dict[str, Dict] = {}
 
+# Preview jobs running in the background, keyed by their progress entry
+preview_tasks: Dict[str, asyncio.Task] = {}
+
 def update_progress(task_id: str, progress: int, stage: str):
     """Update progress for a specific task"""
-    progress_store[task_id] = {"progress": progress, "stage": stage}
+    progress_store.setdefault(task_id, {}).update(progress=progress, stage=stage)
+
+def reset_preview(preview_id: str) -> Dict:
+    """Cancel any preview job still running under this key and start a fresh entry.
+
+    Jobs write to the entry they were started with, so a superseded job can
+    never overwrite the progress or URLs of the one that replaced it.
+    """
+    previous = preview_tasks.pop(preview_id, None)
+    if previous:
+        previous.cancel()
+    entry = {"progress": 0, "stage": "Waiting for inputs"}
+    progress_store[preview_id] = entry
+    return entry
+
+def mark_preview_stopped(entry: Dict, status: str, stage: str):
+    """Record that a preview job ended without completing"""
+    entry["status"] = status
+    entry["stage"] = stage
+
+async def _link_or_copy(source: Path, destination: Path) -> Path:
+    """Give the preview job its own reference to an input file"""
+    if destination.exists():
+        destination.unlink()
+    try:
+        os.link(source, destination)
+    except OSError:
+        # Hardlinks fail across filesystems, and copying 4K clips takes a while
+        await asyncio.to_thread(shutil.copyfile, source, destination)
+    return destination
+
+async def start_preview_job(
+    preview_id: str,
+    entry: Dict,
+    project_id: str,
+    clip_paths: List[Path],
+    audio_path: Optional[Path],
+    output_name: str
+) -> Optional[asyncio.Task]:
+    """Start the preview job in the background on its own copies of the inputs.
+
+    The full-quality path can then clean up its files and respond without
+    waiting for the preview. Returns None if the inputs could not be prepared.
+    """
+    temp_dir = Path(settings.TEMP_DIR)
+    prefix = Path(output_name).stem
+    inputs = [
+        (path, temp_dir / f"{prefix}_preview_clip{i}{path.suffix}")
+        for i, path in enumerate(clip_paths)
+    ]
+    if audio_path:
+        inputs.append((audio_path, temp_dir / f"{prefix}_preview_audio{audio_path.suffix}"))
+    copies = [destination for _, destination in inputs]
+
+    try:
+        for source, destination in inputs:
+            await _link_or_copy(source, destination)
+    except Exception as e:
+        logger.error(f"❌ Failed to prepare preview inputs: {str(e)}")
+        mark_preview_stopped(entry, "error", "Failed")
+        for path in copies:
+            firebase.cleanup(path)
+        return None
+
+    clip_copies = copies[:len(clip_paths)]
+    audio_copy = copies[len(clip_paths)] if audio_path else None
+    task = asyncio.create_task(
+        run_preview_job(entry, project_id, clip_copies, audio_copy, prefix)
+    )
+    # Keep a reference so the task is not garbage collected while running
+    preview_tasks[preview_id] = task
+    task.add_done_callback(lambda t: finish_preview_job(t, preview_id, entry, copies))
+    return task
+
+def finish_preview_job(task: asyncio.Task, preview_id: str, entry: Dict, input_paths: List[Path]):
+    """Release a finished preview job and remove its inputs.
+
+    Done here rather than in the job itself because a job cancelled before it
+    started never runs its own cleanup.
+    """
+    if preview_tasks.get(preview_id) is task:
+        del preview_tasks[preview_id]
+    if task.cancelled():
+        logger.info(f"🛑 Preview job {preview_id} cancelled")
+        mark_preview_stopped(entry, "cancelled", "Cancelled")
+    for path in input_paths:
+        firebase.cleanup(path)
+
+async def run_preview_job(
+    entry: Dict,
+    project_id: str,
+    clip_paths: List[Path],
+    audio_path: Optional[Path],
+    prefix: str
+):
+    """Render and upload a low-resolution preview and per-clip poster frames.
+
+    Reports progress into ``entry``. Failures are logged and never affect the
+    full-quality render.
+    """
+    temp_dir = Path(settings.TEMP_DIR)
+    preview_path = temp_dir / f"{prefix}_preview.mp4"
+    thumbnail_paths = [
+        temp_dir / f"{prefix}_clip{i}_poster.jpg" for i in range(len(clip_paths))
+    ]
+
+    try:
+        # Render and upload the preview first so it is available as soon as possible
+        await video_processor.render_proxy(
+            clip_paths,
+            preview_path,
+            audio_path,
+            lambda p, s: entry.update(progress=p // 2, stage=s)
+        )
+        entry.update(progress=50, stage="Uploading preview")
+        entry["url"] = await firebase.upload_file(
+            preview_path,
+            f"preview/{project_id}/{preview_path.name}",
+            content_type='video/mp4'
+        )
+        logger.info(f"✅ Preview uploaded. URL: {entry['url']}")
+
+        entry.update(progress=70, stage="Extracting thumbnails")
+        await asyncio.gather(*[
+            video_processor.extract_thumbnail(clip_path, thumbnail_path)
+            for clip_path, thumbnail_path in zip(clip_paths, thumbnail_paths)
+        ])
+
+        entry.update(progress=85, stage="Uploading thumbnails")
+        thumbnail_urls = await asyncio.gather(*[
+            firebase.upload_file(
+                path,
+                f"thumbnails/{project_id}/{path.name}",
+                content_type='image/jpeg'
+            )
+            for path in thumbnail_paths
+        ])
+        entry["thumbnail_urls"] = list(thumbnail_urls)
+
+        entry.update(progress=100, stage="Complete")
+    except Exception as e:
+        logger.error(f"❌ Error in preview job: {str(e)}")
+        mark_preview_stopped(entry, "error", "Failed")
+    finally:
+        firebase.cleanup(preview_path)
+        for path in thumbnail_paths:
+            firebase.cleanup(path)
+
+def preview_urls(entry: Dict) -> Dict:
+    """Preview URLs that are already available for a job"""
+    return {
+        "preview_url": entry.get("url"),
+        "thumbnail_urls": entry.get("thumbnail_urls")
+    }
 
 @router.post("/combine-videos", response_model=VideoResponse)
 async def combine_videos(request: VideoCombineRequest, background_tasks: BackgroundTasks):
+    preview_entry = None
+    preview_task = None
+    succeeded = False
     try:
         logger.info(f"📥 Received combine request for project: {request.project_id}")
         logger.info(f"🎬 Number of videos to combine: {len(request.video_urls)}")
@@ -28,6 +190,8 @@ async def combine_videos(request: VideoCombineRequest, background_tasks: Backgro
         
         task_id = f"combine_{request.project_id}"
         progress_store[task_id] = {"progress": 0, "stage": "Initializing"}
+        preview_id = f"preview_{task_id}"
+        preview_entry = reset_preview(preview_id)
         
         # Create output path
         output_name = request.output_name or f"{request.project_id}_combined.mp4"
@@ -42,6 +206,11 @@ async def combine_videos(request: VideoCombineRequest, background_tasks: Backgro
         )
         logger.info(f"✅ Downloaded {len(video_paths)} videos successfully")
         
+        # Start the preview in parallel with the full-quality render
+        preview_task = await start_preview_job(
+            preview_id, preview_entry, request.project_id, video_paths, None, output_name
+        )
+        
         # Combine videos
         logger.info("🔄 Starting video combination...")
         update_progress(task_id, 30, "Combining videos")
@@ -71,10 +240,12 @@ async def combine_videos(request: VideoCombineRequest, background_tasks: Backgro
         logger.info("🧹 Cleanup complete")
         
         update_progress(task_id, 100, "Complete")
+        succeeded = True
         
         return VideoResponse(
             status="success",
             url=result_url,
+            **preview_urls(preview_entry),
             message="Videos combined successfully"
         )
     except Exception as e:
@@ -83,12 +254,24 @@ async def combine_videos(request: VideoCombineRequest, background_tasks: Backgro
             logger.error(f"❌ Response status: {e.response.status_code}")
             logger.error(f"❌ Response text: {e.response.text}")
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        # Don't publish a preview for a request that failed
+        if not succeeded:
+            if preview_task:
+                preview_task.cancel()
+            elif preview_entry is not None and "status" not in preview_entry:
+                mark_preview_stopped(preview_entry, "cancelled", "Cancelled")
 
 @router.post("/add-audio", response_model=VideoResponse)
 async def add_audio(request: AudioAddRequest, background_tasks: BackgroundTasks):
+    preview_entry = None
+    preview_task = None
+    succeeded = False
     try:
         task_id = f"audio_{request.project_id}"
         progress_store[task_id] = {"progress": 0, "stage": "Initializing"}
+        preview_id = f"preview_{task_id}"
+        preview_entry = reset_preview(preview_id)
         
         # Create output path
         output_name = request.output_name or f"{request.project_id}_with_audio.mp4"
@@ -101,6 +284,11 @@ async def add_audio(request: AudioAddRequest, background_tasks: BackgroundTasks)
         update_progress(task_id, 30, "Downloading audio")
         audio_path = await firebase.download_video(str(request.audio_url))
         
+        # Start the preview in parallel with the full-quality render
+        preview_task = await start_preview_job(
+            preview_id, preview_entry, request.project_id, [video_path], audio_path, output_name
+        )
+        
         # Add audio to video
         update_progress(task_id, 50, "Adding audio")
         final_video = await video_processor.add_audio(
@@ -124,15 +312,24 @@ async def add_audio(request: AudioAddRequest, background_tasks: BackgroundTasks)
         firebase.cleanup(output_path)
         
         update_progress(task_id, 100, "Complete")
+        succeeded = True
         
         return VideoResponse(
             status="success",
             url=result_url,
+            **preview_urls(preview_entry),
             message="Audio added successfully"
         )
     except Exception as e:
         logger.error(f"Error in add_audio: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        # Don't publish a preview for a request that failed
+        if not succeeded:
+            if preview_task:
+                preview_task.cancel()
+            elif preview_entry is not None and "status" not in preview_entry:
+                mark_preview_stopped(preview_entry, "cancelled", "Cancelled")
 
 @router.get("/progress/{task_id}", response_model=ProgressResponse)
 async def get_progress(task_id: str):
@@ -144,5 +341,10 @@ async def get_progress(task_id: str):
     return ProgressResponse(
         progress=progress_info["progress"],
         stage=progress_info["stage"],
-        status="complete" if progress_info["progress"] == 100 else "processing"
+        status=progress_info.get(
+            "status",
+            "complete" if progress_info["progress"] == 100 else "processing"
+        ),
+        url=progress_info.get("url"),
+        thumbnail_urls=progress_info.get("thumbnail_urls")
     ) 
\ No newline at end of file
@@ -1,30 +1,19 @@
 import aiohttp
 import logging
 from ..config import settings
+from .lazy import LazyService
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_VOICE_ID = "21m00Tcm4TlvDq8ikWAM"  # Default voice ID (Rachel)
 
-class ElevenLabsService:
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(ElevenLabsService, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-
-    def __init__(self):
-        if self._initialized:
-            return
-            
+class ElevenLabsService(LazyService):
+    def _initialize(self):
         try:
             if not settings.ELEVENLABS_API_KEY:
                 raise ValueError("ElevenLabs API key is not configured")
             
             self.api_key = settings.ELEVENLABS_API_KEY
-            self._initialized = True
             logger.info("✅ ElevenLabs service initialized successfully")
         except Exception as e:
             logger.error(f"❌ Failed to initialize ElevenLabs service: {str(e)}")
@@ -33,6 +22,7 @@ class ElevenLabsService:
     async def get_available_voices(self) -> list:
         """Get list of available voices from ElevenLabs."""
         try:
+            await self.ensure_ready()
             logger.info("🎤 Fetching available voices from ElevenLabs")
             async with aiohttp.ClientSession() as session:
                 async with session.get(
@@ -62,6 +52,7 @@ class ElevenLabsService:
     ) -> bytes:
         """Generate narration audio from script using ElevenLabs API."""
         try:
+            await self.ensure_ready()
             logger.info(f"🎙️ Generating narration with voice ID: {voice_id}")
             logger.info(f"📝 Script length: {len(script)} characters")
 
@@ -1,26 +1,31 @@
-import firebase_admin
-from firebase_admin import credentials, storage
 from pathlib import Path
+from typing import Optional
 import aiohttp
+import asyncio
 from datetime import timedelta
 import json
 from ..config import settings
+from .lazy import LazyService
 import os
 
-class FirebaseService:
-    _instance = None
+# Read size for streamed downloads
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(FirebaseService, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+class FirebaseService(LazyService):
+    # firebase_admin is only initialized on first use (see _initialize)
+    _bucket = None
 
-    def __init__(self):
-        if self._initialized:
-            return
-            
+    @property
+    def bucket(self):
+        self._ensure_initialized()
+        return self._bucket
+
+    def _initialize(self):
         try:
+            # Deferred so the SDK is only loaded when storage is actually needed
+            import firebase_admin
+            from firebase_admin import credentials, storage
+
             # Get the credentials file path and make it absolute
             cred_path = os.path.join(
                 os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
@@ -41,11 +46,15 @@ class FirebaseService:
             if bucket_name.startswith('gs://'):
                 bucket_name = bucket_name[5:]
             
-            firebase_admin.initialize_app(cred, {
-                'storageBucket': bucket_name
-            })
-            self.bucket = storage.bucket()
-            self._initialized = True
+            # A previous attempt may have created the app before failing later on,
+            # and initialize_app refuses to create the default app twice
+            try:
+                firebase_admin.get_app()
+            except ValueError:
+                firebase_admin.initialize_app(cred, {
+                    'storageBucket': bucket_name
+                })
+            self._bucket = storage.bucket()
             print(f"✅ Firebase initialized successfully with bucket: {bucket_name}")
         except Exception as e:
             print(f"❌ Failed to initialize Firebase: {str(e)}")
@@ -65,21 +74,118 @@ class FirebaseService:
             # Create a temporary file path
             temp_path = Path(f"{settings.TEMP_DIR}/{Path(storage_path).name}")
             
-            # Download using aiohttp
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        temp_path.parent.mkdir(parents=True, exist_ok=True)
-                        with open(temp_path, 'wb') as f:
-                            f.write(await response.read())
-                        return temp_path
-                    raise Exception(f"Failed to download video: {response.status}")
+            temp_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Download using aiohttp, splitting large files into concurrent ranges
+            connector = aiohttp.TCPConnector(limit=settings.DOWNLOAD_MAX_CONNECTIONS)
+            async with aiohttp.ClientSession(connector=connector) as session:
+                size = await self._get_ranged_size(session, url)
+                if size is not None and size >= settings.DOWNLOAD_SEGMENT_THRESHOLD:
+                    await self._download_segmented(session, url, temp_path, size)
+                else:
+                    await self._download_single(session, url, temp_path)
+            return temp_path
         except Exception as e:
             raise Exception(f"Error downloading video: {str(e)}")
 
+    @staticmethod
+    async def _get_ranged_size(session: aiohttp.ClientSession, url: str) -> Optional[int]:
+        """Return the object size if the server supports byte ranges, otherwise None"""
+        try:
+            async with session.head(url, allow_redirects=True) as response:
+                if response.status != 200:
+                    return None
+                if response.headers.get('Accept-Ranges', '').lower() != 'bytes':
+                    return None
+                if 'Content-Length' not in response.headers:
+                    return None
+                return int(response.headers['Content-Length'])
+        except Exception as e:
+            print(f"⚠️ HEAD request failed, falling back to single stream: {str(e)}")
+            return None
+
+    @staticmethod
+    async def _download_single(session: aiohttp.ClientSession, url: str, temp_path: Path):
+        """Download the whole object over a single connection"""
+        async with session.get(url) as response:
+            if response.status != 200:
+                raise Exception(f"Failed to download video: {response.status}")
+            with open(temp_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+
+    async def _download_segmented(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        temp_path: Path,
+        size: int
+    ):
+        """Download the object as concurrent byte ranges into a preallocated file"""
+        segment_size = settings.DOWNLOAD_SEGMENT_SIZE
+        ranges = [
+            (start, min(start + segment_size, size) - 1)
+            for start in range(0, size, segment_size)
+        ]
+        print(f"⬇️ Downloading {size / (1024*1024):.2f} MB in {len(ranges)} segments")
+
+        semaphore = asyncio.Semaphore(settings.DOWNLOAD_MAX_CONNECTIONS)
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        tasks = []
+        try:
+            os.ftruncate(fd, size)
+            tasks = [
+                asyncio.create_task(
+                    self._download_range(session, url, fd, start, end, semaphore)
+                )
+                for start, end in ranges
+            ]
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop the remaining ranges before the fd is closed so none of them
+            # can write into it (or into whatever file reuses its number)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.cleanup(temp_path)
+            raise
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    async def _download_range(
+        session: aiohttp.ClientSession,
+        url: str,
+        fd: int,
+        start: int,
+        end: int,
+        semaphore: asyncio.Semaphore
+    ):
+        """Fetch a single byte range and write it at its offset, retrying on failure"""
+        attempts = settings.DOWNLOAD_RANGE_RETRIES + 1
+        for attempt in range(1, attempts + 1):
+            try:
+                async with semaphore:
+                    async with session.get(url, headers={'Range': f"bytes={start}-{end}"}) as response:
+                        if response.status != 206:
+                            raise Exception(f"Unexpected status {response.status}")
+                        offset = start
+                        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                            os.pwrite(fd, chunk, offset)
+                            offset += len(chunk)
+                        if offset != end + 1:
+                            raise Exception(f"Incomplete range, got {offset - start} of {end - start + 1} bytes")
+                return
+            except Exception as e:
+                if attempt == attempts:
+                    raise Exception(f"Failed to download bytes {start}-{end}: {str(e)}")
+                print(f"⚠️ Retrying bytes {start}-{end} (attempt {attempt}/{attempts - 1}): {str(e)}")
+                await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+
     async def upload_video(self, file_path: Path, destination: str) -> str:
         """Upload processed video to Firebase"""
         try:
+            await self.ensure_ready()
             print(f"📤 Starting upload for file: {file_path}")
             print(f"📁 Destination path: {destination}")
             print(f"🪣 Using bucket: {self.bucket.name}")
@@ -89,7 +195,7 @@ class FirebaseService:
             
             print(f"📊 File size: {file_path.stat().st_size / (1024*1024):.2f} MB")
             print("🚀 Starting upload...")
-            blob.upload_from_filename(str(file_path))
+            await asyncio.to_thread(blob.upload_from_filename, str(file_path))
             print("✅ Upload completed successfully")
             
             print("🔑 Generating signed URL...")
@@ -105,6 +211,25 @@ class FirebaseService:
                 print(f"❌ Response text: {e.response.text}")
             raise Exception(f"Error uploading video: {str(e)}")
 
+    async def upload_file(
+        self,
+        file_path: Path,
+        destination: str,
+        content_type: Optional[str] = None
+    ) -> str:
+        """Upload any file to Firebase without blocking the event loop"""
+        def upload() -> str:
+            blob = self.bucket.blob(destination)
+            blob.upload_from_filename(str(file_path), content_type=content_type)
+            return blob.generate_signed_url(timedelta(hours=1))
+
+        try:
+            await self.ensure_ready()
+            return await asyncio.to_thread(upload)
+        except Exception as e:
+            print(f"❌ Upload of {file_path} failed: {str(e)}")
+            raise Exception(f"Error uploading file: {str(e)}")
+
     def cleanup(self, file_path: Path):
         """Clean up temporary files"""
         try:
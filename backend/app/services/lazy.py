@@ -0,0 +1,62 @@
+import asyncio
+import threading
+from typing import Optional
+
+class LazyService:
+    """Singleton base class for services that initialize on first use.
+
+    Subclasses implement ``_initialize`` to do the expensive setup (SDK imports,
+    credential parsing). Constructing the service stays cheap, and async code
+    should call ``ensure_ready`` so that setup never runs on the event loop.
+    """
+    _instance = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Each service gets its own singleton and lock
+        cls._instance = None
+        cls._init_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+            cls._instance._init_error = None
+        return cls._instance
+
+    @classmethod
+    def is_ready(cls) -> bool:
+        """Whether the service has been initialized"""
+        return cls._instance is not None and cls._instance._initialized
+
+    @classmethod
+    def init_error(cls) -> Optional[str]:
+        """The error from the last failed initialization attempt, if any"""
+        return cls._instance._init_error if cls._instance is not None else None
+
+    def warm_up(self):
+        """Initialize the service ahead of the first request"""
+        self._ensure_initialized()
+
+    async def ensure_ready(self):
+        """Initialize the service in a worker thread if it is not ready yet"""
+        if not self._initialized:
+            await asyncio.to_thread(self._ensure_initialized)
+
+    def _ensure_initialized(self):
+        if self._initialized:
+            return
+
+        with self._init_lock:
+            if self._initialized:
+                return
+            try:
+                self._initialize()
+            except Exception as e:
+                self._init_error = str(e)
+                raise
+            self._initialized = True
+            self._init_error = None
+
+    def _initialize(self):
+        raise NotImplementedError
@@ -1,29 +1,22 @@
-import openai
 import os
 import logging
 from ..config import settings
+from .lazy import LazyService
 
 logger = logging.getLogger(__name__)
 
-class OpenAIService:
-    _instance = None
+class OpenAIService(LazyService):
+    # The openai SDK is imported on first use (see _initialize)
+    _openai = None
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(OpenAIService, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-
-    def __init__(self):
-        if self._initialized:
-            return
-            
+    def _initialize(self):
         try:
             if not settings.OPENAI_API_KEY:
                 raise ValueError("OpenAI API key is not configured")
             
+            import openai
             openai.api_key = settings.OPENAI_API_KEY
-            self._initialized = True
+            self._openai = openai
             logger.info("✅ OpenAI service initialized successfully")
         except Exception as e:
             logger.error(f"❌ Failed to initialize OpenAI service: {str(e)}")
@@ -32,6 +25,7 @@ class OpenAIService:
     async def generate_script(self, car_details: str, angle_descriptions: list[str]) -> str:
         """Generate a promotional script based on car details and video angles."""
         try:
+            await self.ensure_ready()
             logger.info("🤖 Generating script with OpenAI")
             logger.info(f"📝 Car details length: {len(car_details)} characters")
             logger.info(f"🎥 Number of angles: {len(angle_descriptions)}")
@@ -58,7 +52,7 @@ class OpenAIService:
             - No additional explanations, only the script itself
             """
 
-            completion = await openai.ChatCompletion.acreate(
+            completion = await self._openai.ChatCompletion.acreate(
                 model="gpt-4",
                 messages=[
                     {
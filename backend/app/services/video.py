@@ -1,11 +1,43 @@
 import ffmpeg
 from pathlib import Path
 import asyncio
+import shutil
 from typing import List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Proxy preview settings: small, fast to encode, and run at a lower CPU
+# priority so the full-quality render is not slowed down
+PROXY_HEIGHT = 360
+PROXY_CRF = 32
+PROXY_AUDIO_BITRATE = '64k'
+PROXY_NICENESS = 10
+PROXY_FPS = 15
+
+def _low_priority_cmd():
+    """FFmpeg command prefixed with nice where available"""
+    if shutil.which('nice'):
+        return ['nice', '-n', str(PROXY_NICENESS), 'ffmpeg']
+    return 'ffmpeg'
+
+async def _run_low_priority(stream):
+    """Run FFmpeg at low priority, killing the process if the caller is cancelled"""
+    process = ffmpeg.run_async(
+        stream,
+        cmd=_low_priority_cmd(),
+        overwrite_output=True,
+        pipe_stdout=True,
+        pipe_stderr=True
+    )
+    try:
+        out, err = await asyncio.to_thread(process.communicate)
+    except asyncio.CancelledError:
+        process.kill()
+        raise
+    if process.returncode != 0:
+        raise ffmpeg.Error('ffmpeg', out, err)
+
 class VideoProcessor:
     @staticmethod
     async def combine_videos(
@@ -110,6 +142,91 @@ class VideoProcessor:
             logger.error(f"Error in add_audio: {str(e)}")
             raise Exception(f"Failed to add audio: {str(e)}")
 
+    @staticmethod
+    async def render_proxy(
+        video_paths: List[Path],
+        output_path: Path,
+        audio_path: Optional[Path] = None,
+        progress_callback: Optional[callable] = None
+    ) -> Path:
+        """Render a low-resolution preview of the combined videos with optional narration"""
+        list_path = output_path.parent / f"{output_path.stem}_list.txt"
+        try:
+            with open(list_path, 'w') as f:
+                for video_path in video_paths:
+                    f.write(f"file '{video_path.absolute()}'\n")
+            
+            if progress_callback:
+                progress_callback(10, "Created file list")
+            
+            video = (
+                ffmpeg.input(str(list_path), format='concat', safe=0)
+                .video
+                .filter('scale', -2, PROXY_HEIGHT)
+                .filter('fps', PROXY_FPS)
+            )
+            streams = [video]
+            if audio_path:
+                streams.append(ffmpeg.input(str(audio_path)).audio)
+            
+            stream = ffmpeg.output(
+                *streams,
+                str(output_path),
+                vcodec='libx264',
+                preset='ultrafast',
+                crf=PROXY_CRF,
+                pix_fmt='yuv420p',
+                acodec='aac',
+                audio_bitrate=PROXY_AUDIO_BITRATE,
+                movflags='+faststart',
+                loglevel='error'
+            )
+            
+            if progress_callback:
+                progress_callback(20, "Rendering preview")
+            
+            await _run_low_priority(stream)
+            
+            if progress_callback:
+                progress_callback(90, "Finalizing preview")
+            
+            return output_path
+            
+        except ffmpeg.Error as e:
+            logger.error(f"FFmpeg error: {e.stderr.decode() if e.stderr else str(e)}")
+            raise Exception(f"Failed to render preview: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error in render_proxy: {str(e)}")
+            raise Exception(f"Failed to render preview: {str(e)}")
+        finally:
+            if list_path.exists():
+                list_path.unlink()
+
+    @staticmethod
+    async def extract_thumbnail(video_path: Path, output_path: Path) -> Path:
+        """Extract a representative poster frame from a video"""
+        try:
+            # Only keyframes are considered, which avoids decoding every frame
+            # of high-resolution clips
+            stream = (
+                ffmpeg.input(str(video_path), skip_frame='nokey')
+                .video
+                .filter('thumbnail')
+                .filter('scale', -2, PROXY_HEIGHT)
+            )
+            stream = ffmpeg.output(stream, str(output_path), vframes=1, loglevel='error')
+            
+            await _run_low_priority(stream)
+            
+            return output_path
+            
+        except ffmpeg.Error as e:
+            logger.error(f"FFmpeg error: {e.stderr.decode() if e.stderr else str(e)}")
+            raise Exception(f"Failed to extract thumbnail: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error in extract_thumbnail: {str(e)}")
+            raise Exception(f"Failed to extract thumbnail: {str(e)}")
+
     @staticmethod
     def get_video_info(video_path: Path) -> dict:
         """Get video metadata using FFmpeg"""
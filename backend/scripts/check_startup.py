@@ -0,0 +1,78 @@
+"""Guard against cold start regressions.
+
+Imports ``app.main`` in a fresh interpreter and fails if the import takes longer
+than the budget or if heavy SDKs are loaded eagerly.
+
+Usage (from the backend directory):
+    python scripts/check_startup.py [--budget-ms 1500] [--runs 3]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# SDKs that must only be imported on first use
+DEFERRED_MODULES = ["firebase_admin", "openai"]
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed_ms = (time.perf_counter() - started) * 1000
+print(json.dumps({
+    "elapsed_ms": elapsed_ms,
+    "loaded": [m for m in %r if m in sys.modules],
+}))
+""" % (DEFERRED_MODULES,)
+
+def run_probe() -> dict:
+    """Import the app once in a new interpreter and report the timing"""
+    env = dict(os.environ)
+    # Required settings only need to be present, services are not contacted
+    env.setdefault("STORAGE_BUCKET", "startup-check")
+    env.setdefault("OPENAI_API_KEY", "startup-check")
+    env.setdefault("ELEVENLABS_API_KEY", "startup-check")
+    env["WARM_UP_ON_STARTUP"] = "false"
+
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing app.main failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=1500.0)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    probes = [run_probe() for _ in range(args.runs)]
+    # The fastest run is the least affected by noise from the machine
+    best_ms = min(p["elapsed_ms"] for p in probes)
+    loaded = sorted({m for p in probes for m in p["loaded"]})
+
+    print(f"app.main import: {best_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if best_ms > args.budget_ms:
+        print(f"❌ Startup exceeded budget by {best_ms - args.budget_ms:.1f} ms")
+        failed = True
+    if loaded:
+        print(f"❌ Deferred modules imported at startup: {', '.join(loaded)}")
+        failed = True
+
+    if not failed:
+        print("✅ Startup check passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
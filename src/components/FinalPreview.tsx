@@ -23,6 +23,7 @@ export default function FinalPreview() {
   const [selectedVoiceId, setSelectedVoiceId] = useState<string>("");
   const [audioBlob, setAudioBlob] = useState<Blob | null>(null);
   const [combinedVideoUrl, setCombinedVideoUrl] = useState<string | null>(null);
+  const [previewUrl, setPreviewUrl] = useState<string | null>(null);
   const [isPlaying, setIsPlaying] = useState(false);
   const videoRef = useRef<HTMLVideoElement>(null);
   const audioRef = useRef<HTMLAudioElement>(null);
@@ -76,7 +77,8 @@ export default function FinalPreview() {
         (progress, stage) => {
           setCombineProgress(progress * 0.5); // First 50% for video combination
           setCombineStage(`Combining videos: ${stage}`);
-        }
+        },
+        setPreviewUrl
       );
 
       // Step 2: If narration exists, add it to the combined video
@@ -89,7 +91,8 @@ export default function FinalPreview() {
           (progress, stage) => {
             setCombineProgress(50 + progress * 0.5); // Last 50% for adding narration
             setCombineStage(`Adding narration: ${stage}`);
-          }
+          },
+          setPreviewUrl
         );
 
         // Save and update preview with the final video
@@ -113,6 +116,7 @@ export default function FinalPreview() {
       setCombiningVideos(false);
       setCombineProgress(0);
       setCombineStage('');
+      setPreviewUrl(null);
     }
   };
   
@@ -169,7 +173,8 @@ export default function FinalPreview() {
         (progress, stage) => {
           setAudioProgress(progress);
           setAudioStage(stage);
-        }
+        },
+        setPreviewUrl
       );
 
       // Save and update preview with the final video
@@ -184,6 +189,7 @@ export default function FinalPreview() {
       toast.error("Failed to add narration to video");
     } finally {
       setProcessing(false);
+      setPreviewUrl(null);
     }
   };
 
@@ -209,6 +215,21 @@ export default function FinalPreview() {
             <CardTitle>Video Preview</CardTitle>
           </CardHeader>
           <CardContent className="space-y-4">
+            {/* Low-resolution preview shown while the full-quality render finishes */}
+            {previewUrl && (combiningVideos || processing) && (
+              <div className="space-y-2">
+                <video
+                  key={previewUrl}
+                  src={previewUrl}
+                  controls
+                  className="w-full rounded-lg"
+                />
+                <p className="text-sm text-muted-foreground">
+                  Quick preview. The full-quality video is still processing.
+                </p>
+              </div>
+            )}
+
             {combinedVideoUrl && (
               <div className="space-y-2">
                 <video
@@ -5,6 +5,8 @@ const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 interface VideoResponse {
   status: string;
   url?: string;
+  preview_url?: string;
+  thumbnail_urls?: string[];
   message?: string;
   error?: string;
 }
@@ -13,6 +15,8 @@ interface ProgressResponse {
   progress: number;
   stage: string;
   status: string;
+  url?: string;
+  thumbnail_urls?: string[];
 }
 
 // AI-related interfaces
@@ -46,8 +50,14 @@ export interface NarrationGenerationRequest {
 export async function combineVideosServer(
   projectId: string,
   videoUrls: string[],
-  onProgress?: (progress: number, stage: string) => void
+  onProgress?: (progress: number, stage: string) => void,
+  onPreview?: (previewUrl: string) => void
 ): Promise<string> {
+  // The low-resolution preview is ready long before the full render finishes
+  const stopPreview = onPreview
+    ? watchPreview(`preview_combine_${projectId}`, onPreview)
+    : () => {};
+
   try {
     // Start the combination process
     const response = await fetch(`${API_BASE_URL}/api/video/combine-videos`, {
@@ -82,6 +92,8 @@ export async function combineVideosServer(
   } catch (error) {
     console.error('Error combining videos:', error);
     throw error;
+  } finally {
+    stopPreview();
   }
 }
 
@@ -89,8 +101,14 @@ export async function addAudioToVideoServer(
   projectId: string,
   videoUrl: string,
   audioUrl: string,
-  onProgress?: (progress: number, stage: string) => void
+  onProgress?: (progress: number, stage: string) => void,
+  onPreview?: (previewUrl: string) => void
 ): Promise<string> {
+  // The low-resolution preview is ready long before the full render finishes
+  const stopPreview = onPreview
+    ? watchPreview(`preview_audio_${projectId}`, onPreview)
+    : () => {};
+
   try {
     // Start the audio addition process
     const response = await fetch(`${API_BASE_URL}/api/video/add-audio`, {
@@ -126,6 +144,8 @@ export async function addAudioToVideoServer(
   } catch (error) {
     console.error('Error adding audio to video:', error);
     throw error;
+  } finally {
+    stopPreview();
   }
 }
 
@@ -156,6 +176,56 @@ async function pollProgress(
   }
 }
 
+// Poll a preview job until its URL is available. Returns a function that stops polling.
+function watchPreview(
+  taskId: string,
+  onPreview: (previewUrl: string) => void,
+  interval: number = 1000
+): () => void {
+  let stopped = false;
+  // The entry from a previous run is still served until the server resets it,
+  // so only trust a URL once the new job has been seen without one
+  let sawNewJob = false;
+
+  const poll = async () => {
+    while (!stopped) {
+      try {
+        const response = await fetch(`${API_BASE_URL}/api/video/progress/${taskId}`);
+        // 404 until the server has received the request
+        if (response.ok) {
+          const progress: ProgressResponse = await response.json();
+          const finished = ['complete', 'error', 'cancelled'].includes(progress.status);
+
+          if (!progress.url && !finished) {
+            sawNewJob = true;
+          }
+
+          if (sawNewJob) {
+            if (progress.url) {
+              if (!stopped) {
+                onPreview(progress.url);
+              }
+              return;
+            }
+            if (finished) {
+              return;
+            }
+          }
+        }
+      } catch (error) {
+        console.error('Error polling preview:', error);
+      }
+
+      await new Promise(resolve => setTimeout(resolve, interval));
+    }
+  };
+
+  poll();
+  return () => {
+    stopped = true;
+  };
+}
+
 // AI-related functions
 export async function generateScript(request: ScriptGenerationRequest): Promise<string> {
   try {